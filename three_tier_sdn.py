@@ -5,12 +5,70 @@ Uses OpenFlow switches with POX controller
 Simulates: Web tier → App tier → Database tier
 """
 
+import time
+
 from mininet.net import Mininet
 from mininet.node import RemoteController, OVSSwitch
 from mininet.cli import CLI
 from mininet.log import setLogLevel, info
 from mininet.link import TCLink
 
+# Printed once the network is up
+RULE = '=' * 60
+
+BANNER = f"""
+{RULE}
+THREE-TIER SDN NETWORK STARTED
+{RULE}
+
+Network Topology (all hosts on 10.0.0.0/24):
+  Web Tier - Switch s1:
+    - web1:   10.0.0.11  (s1-eth1) MAC: 00:00:00:01:01:0a
+    - web2:   10.0.0.12  (s1-eth2) MAC: 00:00:00:01:01:14
+    - lb:     10.0.0.13  (s1-eth3) MAC: 00:00:00:01:01:63
+
+  App Tier - Switch s2:
+    - app1:   10.0.0.21  (s2-eth1) MAC: 00:00:00:02:02:0a
+    - app2:   10.0.0.22  (s2-eth2) MAC: 00:00:00:02:02:14
+    - app3:   10.0.0.23  (s2-eth3) MAC: 00:00:00:02:02:1e
+
+  Database Tier - Switch s3:
+    - db1:    10.0.0.31  (s3-eth1) MAC: 00:00:00:03:03:0a
+    - db2:    10.0.0.32  (s3-eth2) MAC: 00:00:00:03:03:14
+    - victim: 10.0.0.100 (s3-eth3) MAC: 00:00:00:03:03:64
+
+Inter-Switch Links:
+  - s1-eth4 <-> s2-eth4  (Web <-> App)
+  - s2-eth5 <-> s3-eth4  (App <-> Database)
+
+{RULE}
+Controller Status:
+  Check POX controller terminal for switch connections
+  You should see 3 switches connected
+
+Verify flows are installed:
+  mininet> sh ovs-ofctl dump-flows s1
+  mininet> sh ovs-ofctl dump-flows s2
+  mininet> sh ovs-ofctl dump-flows s3
+
+Test Connectivity:
+  mininet> pingall
+
+Start HTTP server on victim:
+  mininet> victim python3 -m http.server 80 &
+
+Run attacks:
+  Cross-tier:  web1 python3 three_tier_attacks.py --all
+  Single host: lb python3 generate_attack_traffic.py 10.0.0.100 all
+
+IDS Monitoring Options:
+  Option 1 (Inter-switch): sudo /media/sf_shared/run_suricata_custom_only.sh s1-eth4
+  Option 2 (Web tier):     sudo /media/sf_shared/run_suricata_custom_only.sh s1-eth1
+  Option 3 (Victim):       sudo /media/sf_shared/run_suricata_custom_only.sh s3-eth3
+
+{RULE}
+"""
+
 def create_three_tier_sdn():
     """Create three-tier SDN network topology"""
 
@@ -85,66 +143,24 @@ def create_three_tier_sdn():
     c0.start()
 
     info('*** Starting switches\n')
-    web_sw.start([c0])
-    app_sw.start([c0])
-    data_sw.start([c0])
-
-    # Wait for switches to connect
+    switches = [web_sw, app_sw, data_sw]
+    # batch=True makes start() queue its ovs-vsctl commands; batchStartup
+    # then runs them for all three switches in one ovs-vsctl call
+    for sw in switches:
+        sw.batch = True
+        sw.start([c0])
+    OVSSwitch.batchStartup(switches)
+
+    # Wait for switches to connect (poll instead of a fixed sleep)
     info('*** Waiting for switches to connect to controller\n')
-    import time
-    time.sleep(3)
-
-    info('\n')
-    info('=' * 60 + '\n')
-    info('THREE-TIER SDN NETWORK STARTED\n')
-    info('=' * 60 + '\n\n')
-
-    info('Network Topology (all hosts on 10.0.0.0/24):\n')
-    info('  Web Tier - Switch s1:\n')
-    info('    - web1:   10.0.0.11  (s1-eth1) MAC: 00:00:00:01:01:0a\n')
-    info('    - web2:   10.0.0.12  (s1-eth2) MAC: 00:00:00:01:01:14\n')
-    info('    - lb:     10.0.0.13  (s1-eth3) MAC: 00:00:00:01:01:63\n\n')
-
-    info('  App Tier - Switch s2:\n')
-    info('    - app1:   10.0.0.21  (s2-eth1) MAC: 00:00:00:02:02:0a\n')
-    info('    - app2:   10.0.0.22  (s2-eth2) MAC: 00:00:00:02:02:14\n')
-    info('    - app3:   10.0.0.23  (s2-eth3) MAC: 00:00:00:02:02:1e\n\n')
-
-    info('  Database Tier - Switch s3:\n')
-    info('    - db1:    10.0.0.31  (s3-eth1) MAC: 00:00:00:03:03:0a\n')
-    info('    - db2:    10.0.0.32  (s3-eth2) MAC: 00:00:00:03:03:14\n')
-    info('    - victim: 10.0.0.100 (s3-eth3) MAC: 00:00:00:03:03:64\n\n')
-
-    info('Inter-Switch Links:\n')
-    info('  - s1-eth4 <-> s2-eth4  (Web <-> App)\n')
-    info('  - s2-eth5 <-> s3-eth4  (App <-> Database)\n\n')
-
-    info('=' * 60 + '\n')
-    info('Controller Status:\n')
-    info('  Check POX controller terminal for switch connections\n')
-    info('  You should see 3 switches connected\n\n')
-
-    info('Verify flows are installed:\n')
-    info('  mininet> sh ovs-ofctl dump-flows s1\n')
-    info('  mininet> sh ovs-ofctl dump-flows s2\n')
-    info('  mininet> sh ovs-ofctl dump-flows s3\n\n')
-
-    info('Test Connectivity:\n')
-    info('  mininet> pingall\n\n')
-
-    info('Start HTTP server on victim:\n')
-    info('  mininet> victim python3 -m http.server 80 &\n\n')
-
-    info('Run attacks:\n')
-    info('  Cross-tier:  web1 python3 three_tier_attacks.py --all\n')
-    info('  Single host: lb python3 generate_attack_traffic.py 10.0.0.100 all\n\n')
-
-    info('IDS Monitoring Options:\n')
-    info('  Option 1 (Inter-switch): sudo /media/sf_shared/run_suricata_custom_only.sh s1-eth4\n')
-    info('  Option 2 (Web tier):     sudo /media/sf_shared/run_suricata_custom_only.sh s1-eth1\n')
-    info('  Option 3 (Victim):       sudo /media/sf_shared/run_suricata_custom_only.sh s3-eth3\n\n')
-
-    info('=' * 60 + '\n')
+    deadline = time.time() + 10
+    while not all(sw.connected() for sw in switches):
+        if time.time() > deadline:
+            info('*** Warning: not all switches connected to the controller\n')
+            break
+        time.sleep(0.1)
+
+    info(BANNER)
 
     # Start CLI
     CLI(net)
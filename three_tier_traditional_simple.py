@@ -5,12 +5,58 @@ Uses standard Mininet switches in standalone mode (non-SDN)
 Better compatibility with IDS monitoring
 """
 
+import os
+
 from mininet.net import Mininet
 from mininet.node import OVSSwitch
 from mininet.cli import CLI
 from mininet.log import setLogLevel, info
 from mininet.link import TCLink
 
+# Printed once the switches are up
+RULE = '=' * 60
+
+BANNER = f"""
+{RULE}
+THREE-TIER TRADITIONAL NETWORK STARTED
+{RULE}
+
+Network Topology (all hosts on 10.0.0.0/24):
+  Web Tier:
+    - web1:   10.0.0.11  (Web server)
+    - web2:   10.0.0.12  (Web server)
+    - lb:     10.0.0.13  (Load balancer)
+
+  App Tier:
+    - app1:   10.0.0.21  (Application server)
+    - app2:   10.0.0.22  (Application server)
+    - app3:   10.0.0.23  (API server)
+
+  Database Tier:
+    - db1:    10.0.0.31  (Primary database)
+    - db2:    10.0.0.32  (Replica database)
+    - victim: 10.0.0.100 (Attack target)
+
+Switches (standalone mode = traditional behavior):
+  - s1  (Web tier switch)
+  - s2  (Application tier switch)
+  - s3  (Database tier switch)
+
+"""
+
+USAGE = f"""{RULE}
+Test Connectivity:
+  mininet> pingall
+
+Start HTTP server on victim:
+  mininet> victim python3 -m http.server 80 &
+
+Run attacks:
+  mininet> web1 python3 /media/sf_shared/three_tier_attacks.py --all
+
+{RULE}
+"""
+
 def create_three_tier_network():
     """Create three-tier network topology with standard switches"""
 
@@ -73,74 +119,36 @@ def create_three_tier_network():
     net.build()
 
     info('*** Starting switches\n')
-    web_sw.start([])  # No controller - standalone mode
-    app_sw.start([])
-    data_sw.start([])
-
-    info('\n')
-    info('=' * 60 + '\n')
-    info('THREE-TIER TRADITIONAL NETWORK STARTED\n')
-    info('=' * 60 + '\n\n')
-
-    info('Network Topology (all hosts on 10.0.0.0/24):\n')
-    info('  Web Tier:\n')
-    info('    - web1:   10.0.0.11  (Web server)\n')
-    info('    - web2:   10.0.0.12  (Web server)\n')
-    info('    - lb:     10.0.0.13  (Load balancer)\n\n')
-
-    info('  App Tier:\n')
-    info('    - app1:   10.0.0.21  (Application server)\n')
-    info('    - app2:   10.0.0.22  (Application server)\n')
-    info('    - app3:   10.0.0.23  (API server)\n\n')
-
-    info('  Database Tier:\n')
-    info('    - db1:    10.0.0.31  (Primary database)\n')
-    info('    - db2:    10.0.0.32  (Replica database)\n')
-    info('    - victim: 10.0.0.100 (Attack target)\n\n')
-
-    info('Switches (standalone mode = traditional behavior):\n')
-    info('  - s1  (Web tier switch)\n')
-    info('  - s2  (Application tier switch)\n')
-    info('  - s3  (Database tier switch)\n\n')
-
-    # Show network topology
-    info('Network connections:\n')
-    net.pingAll()
-    info('\n')
+    switches = [web_sw, app_sw, data_sw]
+    # No controller - standalone mode. batch=True makes start() queue its
+    # ovs-vsctl commands; batchStartup then runs them for all three
+    # switches in one ovs-vsctl call
+    for sw in switches:
+        sw.batch = True
+        sw.start([])
+    OVSSwitch.batchStartup(switches)
+
+    info(BANNER)
+
+    # Full pingall (72 sequential pings) only on request; run `pingall`
+    # from the CLI to check connectivity otherwise
+    if os.getenv('SMOKE_TEST'):
+        info('Network connections:\n')
+        net.pingAll()
 
     # Find victim's interface
-    info('=' * 60 + '\n')
-    info('IDS MONITORING SETUP:\n')
-    info('=' * 60 + '\n')
+    info(f'\n{RULE}\nIDS MONITORING SETUP:\n{RULE}\n')
 
     # Get victim's interface on data-sw
-    for link in net.links:
-        if victim in (link.intf1.node, link.intf2.node):
-            if link.intf1.node == victim:
-                victim_intf = link.intf1.name
-                switch_intf = link.intf2.name
-            else:
-                victim_intf = link.intf2.name
-                switch_intf = link.intf1.name
-
-            if 's3' in switch_intf:
-                info(f'\nVictim interface: {victim_intf}\n')
-                info(f'Switch interface: {switch_intf}\n\n')
-                info('To monitor victim traffic:\n')
-                info(f'  Terminal 2: sudo /media/sf_shared/run_suricata_custom_only.sh {switch_intf}\n\n')
-                break
-
-    info('=' * 60 + '\n')
-    info('Test Connectivity:\n')
-    info('  mininet> pingall\n\n')
-
-    info('Start HTTP server on victim:\n')
-    info('  mininet> victim python3 -m http.server 80 &\n\n')
-
-    info('Run attacks:\n')
-    info('  mininet> web1 python3 /media/sf_shared/three_tier_attacks.py --all\n\n')
-
-    info('=' * 60 + '\n')
+    conns = victim.connectionsTo(data_sw)
+    if conns:
+        victim_intf, switch_intf = conns[0]
+        info(f'\nVictim interface: {victim_intf.name}\n'
+             f'Switch interface: {switch_intf.name}\n\n'
+             'To monitor victim traffic:\n'
+             f'  Terminal 2: sudo /media/sf_shared/run_suricata_custom_only.sh {switch_intf.name}\n\n')
+
+    info(USAGE)
 
     # Start CLI
     CLI(net)